@@ -1,13 +1,58 @@
 #!/usr/bin/env python3
 
+import copy
+import io
+import itertools
 import json
+import mmap
 import os
+import re
 import shutil
 import sys
-import xml.etree.ElementTree as ET
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
+from xml.sax.saxutils import escape
+
+try:
+    # lxml's C-backed parser/serializer is a near drop-in for ElementTree
+    # and is noticeably faster on parse and write.
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+
+# Opening of the Mods children block, used to splice new entries in by bytes
+_MODS_CHILDREN_RE = re.compile(rb'<node id="Mods">\s*<children>')
+
+if _HAVE_LXML:
+    # Compile the hot XPath expressions once at import instead of
+    # re-parsing the predicate strings on every find call.
+    _MODS_CHILDREN_XPATH = ET.XPath(".//node[@id='Mods']/children")
+    _MODULE_NODES_XPATH = ET.XPath("node[@id='ModuleShortDesc']")
+    _FOLDER_ATTR_XPATH = ET.XPath("attribute[@id='Folder']")
+
+    def _find_mods_children(root):
+        nodes = _MODS_CHILDREN_XPATH(root)
+        return nodes[0] if nodes else None
+
+    def _find_module_nodes(mods_children):
+        return _MODULE_NODES_XPATH(mods_children)
+
+    def _find_folder_attr(module):
+        attrs = _FOLDER_ATTR_XPATH(module)
+        return attrs[0] if attrs else None
+else:
+    def _find_mods_children(root):
+        return root.find(".//node[@id='Mods']/children")
+
+    def _find_module_nodes(mods_children):
+        return mods_children.findall("node[@id='ModuleShortDesc']")
+
+    def _find_folder_attr(module):
+        return module.find("attribute[@id='Folder']")
 
 
 class BG3ModInstaller:
@@ -20,23 +65,86 @@ class BG3ModInstaller:
         self.mods_path = self.larian_path / "Baldur's Gate 3/Mods"
         self.profile_modsettings = self.larian_path / "Baldur's Gate 3/PlayerProfiles/Public/modsettings.lsx"
 
+        # Parsed modsettings trees keyed by path, validated against mtime
+        self._tree_cache: Dict[Path, tuple] = {}
+        self._steam_id: Optional[str] = None
+        self._userdata_modsettings: Optional[Path] = None
+        self._mods_path_ready = False
+
+    def _parse_modsettings(self, settings_path: Path):
+        """Parse a modsettings.lsx file, reusing a cached tree when unchanged."""
+        st = os.stat(settings_path)
+        cached = self._tree_cache.get(settings_path)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return ET.ElementTree(copy.deepcopy(cached[1]))
+        root = ET.fromstring(self._read_bytes(settings_path))
+        tree = ET.ElementTree(root)
+        self._tree_cache[settings_path] = (st.st_mtime_ns, copy.deepcopy(root))
+        return tree
+
+    @staticmethod
+    def _read_bytes(settings_path: Path) -> bytes:
+        """Read a whole file through mmap, skipping buffered-IO copies."""
+        with open(settings_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return bytes(mm)
+
+    def _write_modsettings(self, tree, settings_path: Path):
+        """Serialize a tree to disk atomically via a sibling temp file."""
+        tmp = settings_path.with_suffix(settings_path.suffix + '.tmp')
+        with open(tmp, 'wb', buffering=1 << 20) as f:
+            tree.write(f, encoding="utf-8", xml_declaration=True)
+        os.replace(tmp, settings_path)
+        self._tree_cache.pop(settings_path, None)
+
     def get_steam_id(self):
         """Get the first Steam ID from userdata directory."""
+        if self._steam_id is not None:
+            return self._steam_id
         try:
-            steam_ids = [d for d in os.listdir(self.steam_userdata) if d.isdigit()]
-            if not steam_ids:
-                raise Exception("No Steam ID found in userdata directory")
-            return steam_ids[0]
+            with os.scandir(self.steam_userdata) as entries:
+                for entry in entries:
+                    if entry.name.isdigit():
+                        self._steam_id = entry.name
+                        return entry.name
+            raise Exception("No Steam ID found in userdata directory")
         except Exception as e:
             print(f"Error finding Steam ID: {e}")
             sys.exit(1)
 
+    def _get_userdata_modsettings(self) -> Path:
+        """Resolve and memoize the userdata modsettings.lsx path."""
+        if self._userdata_modsettings is None:
+            steam_id = self.get_steam_id()
+            self._userdata_modsettings = self.steam_userdata / steam_id / self.game_id / "modsettings.lsx"
+        return self._userdata_modsettings
+
+    def _apply_to_modsettings(self, apply_func):
+        """Run a per-file modsettings update on both copies concurrently.
+
+        The profile and userdata files live on independent inodes, so the
+        two parse/mutate/write rounds are run on a small thread pool and
+        overlap their I/O. If the userdata copy does not exist yet it is
+        created afterwards by syncing the updated profile file.
+        """
+        targets = [self.profile_modsettings]
+        userdata_modsettings = self._get_userdata_modsettings()
+        if userdata_modsettings.exists():
+            targets.append(userdata_modsettings)
+
+        if len(targets) == 1:
+            apply_func(targets[0])
+            self.sync_modsettings()
+            return
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(apply_func, targets))
+
     def sync_modsettings(self):
         """Copy the main modsettings.lsx file to the userdata location."""
         try:
-            steam_id = self.get_steam_id()
-            userdata_modsettings = self.steam_userdata / steam_id / self.game_id / "modsettings.lsx"
-            
+            userdata_modsettings = self._get_userdata_modsettings()
+
             userdata_modsettings.parent.mkdir(parents=True, exist_ok=True)
             
             shutil.copy2(self.profile_modsettings, userdata_modsettings)
@@ -48,16 +156,14 @@ class BG3ModInstaller:
     def get_installed_mods(self) -> List[Dict]:
         """Get list of currently installed mods from modsettings.lsx."""
         try:
-            tree = ET.parse(self.profile_modsettings)
-            root = tree.getroot()
             mods = []
-            
-            for mod in root.findall(".//node[@id='ModuleShortDesc']"):
-                mod_info = {}
-                for attr in mod.findall("attribute"):
-                    mod_info[attr.get('id')] = attr.get('value')
-                mods.append(mod_info)
-            
+            with open(self.profile_modsettings, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for event, elem in ET.iterparse(mm, events=('end',)):
+                    if elem.tag == 'node' and elem.get('id') == 'ModuleShortDesc':
+                        mods.append({attr.get('id'): attr.get('value')
+                                     for attr in elem.findall('attribute')})
+                        elem.clear()
             return mods
         except Exception as e:
             print(f"Error reading installed mods: {e}")
@@ -67,9 +173,10 @@ class BG3ModInstaller:
         """Extract mod information from a zip file."""
         try:
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                info_files = [f for f in zip_ref.namelist() if f.endswith('info.json')]
-                if info_files:
-                    info_data = json.loads(zip_ref.read(info_files[0]))
+                info_file = next((f for f in zip_ref.namelist() if f.endswith('info.json')), None)
+                if info_file is not None:
+                    with zip_ref.open(info_file) as f:
+                        info_data = json.load(io.TextIOWrapper(f, encoding='utf-8'))
                     if "Mods" in info_data and len(info_data["Mods"]) > 0:
                         return info_data["Mods"][0]
             return None
@@ -116,80 +223,153 @@ class BG3ModInstaller:
 
             # Remove .pak file
             pak_path = self.mods_path / f"{mod_folder}.pak"
-            if pak_path.exists():
+            try:
                 pak_path.unlink()
                 print(f"Removed pak file: {pak_path}")
+            except FileNotFoundError:
+                pass
 
             # Update modsettings.lsx
-            tree = ET.parse(self.profile_modsettings)
-            root = tree.getroot()
-            
-            mods_children = root.find(".//node[@id='Mods']/children")
-            if mods_children is not None:
-                for mod in mods_children.findall("node[@id='ModuleShortDesc']"):
-                    folder = mod.find("attribute[@id='Folder']")
-                    if folder is not None and folder.get('value') == mod_folder:
-                        mods_children.remove(mod)
-                        break
-            
-            tree.write(self.profile_modsettings, encoding="utf-8", xml_declaration=True)
-            print(f"Updated {self.profile_modsettings}")
-            
-            self.sync_modsettings()
+            def _apply(settings_path):
+                tree = self._parse_modsettings(settings_path)
+                root = tree.getroot()
+
+                dirty = False
+                mods_children = _find_mods_children(root)
+                if mods_children is not None:
+                    for mod in _find_module_nodes(mods_children):
+                        folder = _find_folder_attr(mod)
+                        if folder is not None and folder.get('value') == mod_folder:
+                            mods_children.remove(mod)
+                            dirty = True
+                            break
+
+                # Nothing matched in this file; skip the pointless rewrite
+                if dirty:
+                    self._write_modsettings(tree, settings_path)
+                    print(f"Updated {settings_path}")
+
+            self._apply_to_modsettings(_apply)
             return True
 
         except Exception as e:
             print(f"Error removing mod: {e}")
             return False
 
-    def create_mod_xml(self, mod_info):
-        """Create XML structure for mod entry."""
-        module = ET.Element("node")
-        module.set("id", "ModuleShortDesc")
-        
-        attributes = {
+    def _module_attributes(self, mod_info) -> Dict[str, str]:
+        """Map mod info onto the ModuleShortDesc attribute set."""
+        return {
             "Folder": mod_info["Folder"],
             "MD5": mod_info.get("MD5", ""),
             "Name": mod_info["Name"],
             "UUID": mod_info["UUID"],
             "Version64": str(mod_info.get("Version", "36028797018963968"))
         }
-        
-        for key, value in attributes.items():
+
+    def create_mod_xml(self, mod_info):
+        """Create XML structure for mod entry."""
+        module = ET.Element("node")
+        module.set("id", "ModuleShortDesc")
+
+        for key, value in self._module_attributes(mod_info).items():
             attr = ET.SubElement(module, "attribute")
             attr.set("id", key)
             attr.set("type", "LSString")
             attr.set("value", value)
-            
+
         return module
 
+    def _render_module_bytes(self, mod_info) -> bytes:
+        """Serialize a ModuleShortDesc entry to UTF-8 bytes without a tree."""
+        parts = ['<node id="ModuleShortDesc">']
+        for key, value in self._module_attributes(mod_info).items():
+            escaped = escape(value, {'"': '&quot;'})
+            parts.append(f'<attribute id="{key}" type="LSString" value="{escaped}"/>')
+        parts.append('</node>')
+        return ''.join(parts).encode('utf-8')
+
+    def _append_module_bytes(self, settings_path: Path, rendered: bytes) -> bool:
+        """Splice a rendered module into the Mods children via a byte insert.
+
+        Returns False when the anchor cannot be found, in which case the
+        caller should fall back to the full parse-and-write path.
+        """
+        try:
+            data = settings_path.read_bytes()
+        except OSError:
+            return False
+        match = _MODS_CHILDREN_RE.search(data)
+        if match is None:
+            return False
+        # Append at the end of the block so the load order is preserved;
+        # ModuleShortDesc nodes have no nested children, so the first close
+        # after the anchor belongs to the Mods block.
+        pos = data.find(b'</children>', match.end())
+        if pos == -1:
+            return False
+        tmp = settings_path.with_suffix(settings_path.suffix + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(data[:pos])
+            f.write(rendered)
+            f.write(data[pos:])
+        os.replace(tmp, settings_path)
+        self._tree_cache.pop(settings_path, None)
+        return True
+
     def update_modsettings(self, mod_info):
         """Update modsettings.lsx file with new mod information."""
         try:
-            tree = ET.parse(self.profile_modsettings)
-            root = tree.getroot()
-            
-            mods_children = root.find(".//node[@id='Mods']/children")
-            if mods_children is None:
-                raise Exception("Mods children section not found in modsettings.lsx")
-            
-            new_module = self.create_mod_xml(mod_info)
-            mods_children.append(new_module)
-            
-            tree.write(self.profile_modsettings, encoding="utf-8", xml_declaration=True)
-            print(f"Updated {self.profile_modsettings}")
-            
-            self.sync_modsettings()
-            
+            rendered = self._render_module_bytes(mod_info)
+
+            def _apply(settings_path):
+                # Fast path: splice the serialized entry in without
+                # reparsing and rewriting the whole document.
+                if self._append_module_bytes(settings_path, rendered):
+                    print(f"Updated {settings_path}")
+                    return
+
+                tree = self._parse_modsettings(settings_path)
+                root = tree.getroot()
+
+                mods_children = _find_mods_children(root)
+                if mods_children is None:
+                    raise Exception(f"Mods children section not found in {settings_path}")
+
+                mods_children.append(self.create_mod_xml(mod_info))
+                self._write_modsettings(tree, settings_path)
+                print(f"Updated {settings_path}")
+
+            self._apply_to_modsettings(_apply)
+
         except Exception as e:
             print(f"Error updating modsettings: {e}")
             sys.exit(1)
 
+    @staticmethod
+    def _fast_copy(src: Path, dst: Path):
+        """Copy a file, keeping the bytes in the kernel when possible."""
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            try:
+                remaining = os.fstat(s.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            except (AttributeError, OSError):
+                s.seek(0)
+                d.seek(0)
+                d.truncate()
+                shutil.copyfileobj(s, d, 1 << 20)
+        shutil.copystat(src, dst)
+
     def install_mod(self, mod_path):
         """Install a mod from a zip file or directory."""
         try:
-            # Create mods directory if it doesn't exist
-            self.mods_path.mkdir(parents=True, exist_ok=True)
+            # Create mods directory if it doesn't exist (once per session)
+            if not self._mods_path_ready:
+                self.mods_path.mkdir(parents=True, exist_ok=True)
+                self._mods_path_ready = True
             
             if mod_path.suffix.lower() in ['.zip', '.rar', '.7z']:
                 # Get mod info and confirm installation
@@ -201,18 +381,26 @@ class BG3ModInstaller:
                 
                 # Extract archive
                 with zipfile.ZipFile(mod_path, 'r') as zip_ref:
-                    pak_files = [f for f in zip_ref.namelist() if f.endswith('.pak')]
-                    info_files = [f for f in zip_ref.namelist() if f.endswith('info.json')]
-                    
-                    if not pak_files:
+                    infos = zip_ref.infolist()
+                    info_file = next((i for i in infos if i.filename.endswith('info.json')), None)
+
+                    pak_iter = (i for i in infos if i.filename.endswith('.pak'))
+                    first_pak = next(pak_iter, None)
+                    if first_pak is None:
                         raise Exception("No .pak files found in archive")
-                    
-                    for pak_file in pak_files:
-                        zip_ref.extract(pak_file, self.mods_path)
-                        print(f"Installed {pak_file} to mods directory")
-                    
-                    if info_files:
-                        info_data = json.loads(zip_ref.read(info_files[0]))
+
+                    mods_path = self.mods_path
+                    for info in itertools.chain([first_pak], pak_iter):
+                        if info.file_size == 0:
+                            continue
+                        dest = mods_path / os.path.basename(info.filename)
+                        with zip_ref.open(info) as src, open(dest, 'wb', buffering=0) as dst:
+                            shutil.copyfileobj(src, dst, min(info.file_size, 1 << 20))
+                        print(f"Installed {info.filename} to mods directory")
+
+                    if info_file is not None:
+                        with zip_ref.open(info_file) as f:
+                            info_data = json.load(io.TextIOWrapper(f, encoding='utf-8'))
                         if "Mods" in info_data and len(info_data["Mods"]) > 0:
                             self.update_modsettings(info_data["Mods"][0])
                     
@@ -227,7 +415,7 @@ class BG3ModInstaller:
                         break
                     print("Please answer with 'yes' or 'no'")
                 
-                shutil.copy2(mod_path, self.mods_path)
+                self._fast_copy(mod_path, self.mods_path / mod_path.name)
                 print(f"Installed {mod_path.name} to mods directory")
                 
             else:
@@ -244,13 +432,10 @@ def display_menu():
     print("2. Remove mod")
     print("3. Exit")
     while True:
-        try:
-            choice = int(input("\nEnter your choice (1-3): "))
-            if 1 <= choice <= 3:
-                return choice
-            print("Please enter a number between 1 and 3")
-        except ValueError:
-            print("Please enter a valid number")
+        choice = input("\nEnter your choice (1-3): ").strip()
+        if len(choice) == 1 and choice in '123':
+            return int(choice)
+        print("Please enter a number between 1 and 3")
 
 def display_installed_mods(mods: List[Dict]):
     """Display installed mods and get user choice for removal."""
@@ -259,14 +444,15 @@ def display_installed_mods(mods: List[Dict]):
         print(f"{i + 1}. {mod['Name']} ({mod['Folder']})")
     
     while True:
-        try:
-            choice = int(input("\nEnter the number of the mod to remove (0 to cancel): "))
-            if choice == 0:
+        choice = input("\nEnter the number of the mod to remove (0 to cancel): ").strip()
+        if choice.isdigit():
+            value = int(choice)
+            if value == 0:
                 return None
-            if 1 <= choice <= len(mods):
-                return choice - 1
+            if 1 <= value <= len(mods):
+                return value - 1
             print(f"Please enter a number between 0 and {len(mods)}")
-        except ValueError:
+        else:
             print("Please enter a valid number")
 
 def main():